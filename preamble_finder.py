@@ -1,227 +1,412 @@
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
 import matplotlib.pyplot as plt
-from collections import defaultdict
+import numpy as np
+
+# Bit-reversed value of every possible byte, for use with bytes.translate
+_RBIT_TABLE = bytes(int(format(i, "08b")[::-1], 2) for i in range(256))
+# Same table as an array, for reversing numpy arrays by fancy indexing
+_RBIT_LUT = np.frombuffer(_RBIT_TABLE, dtype=np.uint8)
+
+# Header words following each preamble, as read from the bit-reversed data
+_HEADER_DTYPE = np.dtype(
+    [
+        (field, "<u4")
+        for field in (
+            "linked_list",
+            "frame_num",
+            "buffer_count",
+            "frame_buffer_count",
+            "write_buffer_count",
+            "dropped_buffer_count",
+            "timestamp",
+            "write_timestamp",
+            "pixel_count",
+            "battery_voltage_raw",
+            "input_voltage_raw",
+            "unix_time",
+        )
+    ]
+)
+
+
+@contextmanager
+def map_file(filename):
+    """
+    Memory-map a file read-only, hinting that it will be read sequentially.
+
+    Used as ``with map_file(filename) as data:``. The mapping is closed on
+    exit, so numpy views of it must be dropped before the block ends. An
+    empty file can't be mapped, so it comes back as empty bytes.
+    """
+    with open(filename, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    with data:
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            data.madvise(mmap.MADV_SEQUENTIAL)
+        yield data
 
 
 def reverse_bits(byte):
     """Reverse the bits in a byte"""
-    return int(format(byte, "08b")[::-1], 2)
+    return _RBIT_TABLE[byte]
+
+
+def bitrev32(x):
+    """Reverse the bits in a 32-bit word, given as an int or a np.uint32 array"""
+    x = ((x >> 1) & 0x55555555) | ((x & 0x55555555) << 1)
+    x = ((x >> 2) & 0x33333333) | ((x & 0x33333333) << 2)
+    x = ((x >> 4) & 0x0F0F0F0F) | ((x & 0x0F0F0F0F) << 4)
+    x = ((x >> 8) & 0x00FF00FF) | ((x & 0x00FF00FF) << 8)
+    return ((x >> 16) | (x << 16)) & 0xFFFFFFFF
 
 
 def reverse_32bit_word(word_bytes):
     """Try different ways of reversing a 32-bit word"""
-    # Original bytes
-    word_orig = word_bytes
+    word = int.from_bytes(word_bytes, "big")
 
-    # Reverse bytes then bits
-    word_rev_bytes = word_bytes[::-1]
-    word_rev_bits = bytes(reverse_bits(b) for b in word_bytes)
+    # Reversing all 32 bits reverses both the bytes and the bits within them,
+    # so emitting it little-endian leaves only the bits within each byte reversed
+    word_reversed = bitrev32(word)
 
-    # Reverse both
-    word_rev_both = bytes(reverse_bits(b) for b in word_bytes[::-1])
-
-    return [word_orig, word_rev_bytes, word_rev_bits, word_rev_both]
+    return [
+        word.to_bytes(4, "big"),  # Original bytes
+        word.to_bytes(4, "little"),  # Reversed bytes
+        word_reversed.to_bytes(4, "little"),  # Reversed bits
+        word_reversed.to_bytes(4, "big"),  # Reversed both
+    ]
 
 
-def analyze_blocks(filename, block_size=512, header_len=384):
+def analyze_blocks(filename, block_size=512, header_len=384, tile_size=1 << 16):
     """
     Analyze blocks looking for:
     1. Frame numbers (~18727) in bit-reversed data
     2. Preamble (0x12345678) in bit-reversed form
     3. Frame buffer count (0-7)
-    """
-    with open(filename, "rb") as f:
-        data = f.read()
-
-    file_size = len(data)
-    num_blocks = file_size // block_size
-    header_bytes = header_len // 8
 
-    print(f"File size: {file_size} bytes ({file_size / 1024 / 1024:.1f} MB)")
-    print(f"Number of complete blocks: {num_blocks}")
-    print(f"Header size: {header_bytes} bytes")
-
-    # Create bit-reversed version of preamble
-    preamble = bytes.fromhex("12345678")
-    preamble_reversed = bytes(reverse_bits(b) for b in preamble)
-    print("\nPreamble patterns we're looking for:")
-    print("Original:", " ".join(f"{b:02X}" for b in preamble))
-    print("Bit-reversed:", " ".join(f"{b:02X}" for b in preamble_reversed))
-
-    print("\nAnalyzing blocks...")
-    for block_num in range(num_blocks - 8):
-        block_start = block_num * block_size
-
-        # Look at a larger window to catch preamble
-        window = data[block_start - 32 if block_start >= 32 else 0 : block_start + 64]
-        window_reversed = bytes(reverse_bits(b) for b in window)
-
-        # Check for preamble patterns
-        if preamble in window or preamble_reversed in window:
-            print(
-                f"\nFound preamble pattern near block {block_num} (0x{block_start:08X})"
-            )
-            print("Window:", " ".join(f"{b:02X}" for b in window))
-            print("Window (reversed):", " ".join(f"{b:02X}" for b in window_reversed))
-
-        # Look at header values
-        header = data[block_start : block_start + 32]
-        header_reversed = bytes(reverse_bits(b) for b in header)
-
-        # Try both endianness
-        for byte_order in ["little", "big"]:
-            values = [
-                int.from_bytes(header_reversed[i : i + 4], byte_order)
-                for i in range(0, len(header_reversed), 4)
-            ]
-
-            # Debug: Show more values that might be interesting
-            interesting = any(
-                18700 < v < 18900  # Frame numbers
-                or 0 <= v < 8  # Buffer count
-                or 149000 < v < 151000  # Buffer numbers from CSV
-                for v in values
-            )
-
-            if interesting:
+    Headers are bit-reversed and checked tile_size bytes of blocks at a time,
+    so the temporary arrays stay small however large the file is.
+    """
+    with map_file(filename) as data:
+
+        file_size = len(data)
+        num_blocks = file_size // block_size
+        header_bytes = header_len // 8
+
+        print(f"File size: {file_size} bytes ({file_size / 1024 / 1024:.1f} MB)")
+        print(f"Number of complete blocks: {num_blocks}")
+        print(f"Header size: {header_bytes} bytes")
+
+        # Create bit-reversed version of preamble
+        preamble = bytes.fromhex("12345678")
+        preamble_reversed = preamble.translate(_RBIT_TABLE)
+        print("\nPreamble patterns we're looking for:")
+        print("Original:", " ".join(f"{b:02X}" for b in preamble))
+        print("Bit-reversed:", " ".join(f"{b:02X}" for b in preamble_reversed))
+
+        print("\nAnalyzing blocks...")
+        num_checked = max(num_blocks - 8, 0)
+        blocks = np.frombuffer(data, dtype=np.uint8, count=num_checked * block_size)
+        blocks = blocks.reshape(num_checked, block_size)
+
+        # Bit-reverse the headers a tile at a time, read them as 32-bit words and
+        # keep only which blocks have interesting values
+        word_dtypes = {"little": "<u4", "big": ">u4"}
+        interesting = {
+            byte_order: np.zeros(num_checked, dtype=bool) for byte_order in word_dtypes
+        }
+        tile_blocks = max(tile_size // block_size, 1)
+        for tile_start in range(0, num_checked, tile_blocks):
+            tile = slice(tile_start, tile_start + tile_blocks)
+            headers_reversed = _RBIT_LUT[blocks[tile, :32]]
+            for byte_order, dtype in word_dtypes.items():
+                v = headers_reversed.view(dtype)
+                # Debug: Show more values that might be interesting
+                interesting[byte_order][tile] = (
+                    ((v > 18700) & (v < 18900))  # Frame numbers
+                    | (v < 8)  # Buffer count
+                    | ((v > 149000) & (v < 151000))  # Buffer numbers from CSV
+                ).any(axis=1)
+        # The mapping can't be closed while a view of it is alive
+        del blocks
+
+        # Blocks whose window (32 bytes before to 64 bytes after the block start)
+        # contains a preamble pattern
+        window_before, window_after = 32, 64
+        preamble_blocks = set()
+        for pattern in (preamble, preamble_reversed):
+            pos = data.find(pattern)
+            while pos != -1:
+                first = max(-(-(pos + len(pattern) - window_after) // block_size), 0)
+                last = min((pos + window_before) // block_size, num_checked - 1)
+                preamble_blocks.update(range(first, last + 1))
+                pos = data.find(pattern, pos + 1)
+
+        report = np.flatnonzero(interesting["little"] | interesting["big"])
+        for block_num in sorted(preamble_blocks.union(report.tolist())):
+            block_start = block_num * block_size
+
+            # Check for preamble patterns
+            if block_num in preamble_blocks:
+                # Look at a larger window to catch preamble
+                window = data[
+                    max(block_start - window_before, 0) : block_start + window_after
+                ]
+                window_reversed = window.translate(_RBIT_TABLE)
+                print(
+                    f"\nFound preamble pattern near block {block_num} (0x{block_start:08X})"
+                )
+                print("Window:", " ".join(f"{b:02X}" for b in window))
                 print(
-                    f"\nInteresting values at block {block_num} (0x{block_start:08X}):"
+                    "Window (reversed):", " ".join(f"{b:02X}" for b in window_reversed)
                 )
-                print(f"Values ({byte_order}-endian):", values)
-                print("Original bytes:", " ".join(f"{b:02X}" for b in header))
-                print("Bit-reversed:", " ".join(f"{b:02X}" for b in header_reversed))
-
-                # Show previous bytes for context
-                if block_start >= 32:
-                    prev = data[block_start - 32 : block_start]
-                    prev_reversed = bytes(reverse_bits(b) for b in prev)
-                    print("Previous (original):", " ".join(f"{b:02X}" for b in prev))
+
+            # Look at header values
+            header = data[block_start : block_start + 32]
+            header_reversed = header.translate(_RBIT_TABLE)
+
+            # Try both endianness
+            for byte_order in ["little", "big"]:
+                if interesting[byte_order][block_num]:
                     print(
-                        "Previous (reversed):",
-                        " ".join(f"{b:02X}" for b in prev_reversed),
+                        f"\nInteresting values at block {block_num} (0x{block_start:08X}):"
+                    )
+                    values = np.frombuffer(
+                        header_reversed, dtype=word_dtypes[byte_order]
                     )
+                    print(f"Values ({byte_order}-endian):", values.tolist())
+                    print("Original bytes:", " ".join(f"{b:02X}" for b in header))
+                    print(
+                        "Bit-reversed:", " ".join(f"{b:02X}" for b in header_reversed)
+                    )
+
+                    # Show previous bytes for context
+                    if block_start >= 32:
+                        prev = data[block_start - 32 : block_start]
+                        prev_reversed = prev.translate(_RBIT_TABLE)
+                        print(
+                            "Previous (original):", " ".join(f"{b:02X}" for b in prev)
+                        )
+                        print(
+                            "Previous (reversed):",
+                            " ".join(f"{b:02X}" for b in prev_reversed),
+                        )
 
 
-def find_preamble_and_analyze_pixels(filename):
+def find_preamble_positions(data, preamble, start=0, stop=None):
+    """
+    Find every bit-level occurrence of a preamble in data.
+
+    For each of the 8 bit offsets, the bytes the shifted preamble covers
+    completely are searched with bytes.find, and the partially covered
+    edge bytes are checked against a mask afterwards.
+
+    Only occurrences starting in data[start:stop] are returned, though they
+    may run past stop. data is searched in place, so a mmap is never copied.
+
+    Returns a sorted list of (byte_pos, bit_offset) tuples, where bit_offset
+    counts from the most significant bit of the byte at byte_pos.
+    """
+    if stop is None:
+        stop = len(data)
+    n_bytes = len(preamble)
+    n_bits = n_bytes * 8
+    # The searched bytes of a preamble starting just before stop end at most
+    # n_bytes - 1 bytes past it; edge bytes are checked by index, not found
+    end = min(stop + n_bytes - 1, len(data))
+    value = int.from_bytes(preamble, "big")
+    full_mask = (1 << n_bits) - 1
+
+    positions = []
+    for bit_offset in range(8):
+        # Pattern and mask spanning n_bytes + 1 bytes, preamble starting bit_offset
+        # bits into the first byte
+        shift = 8 - bit_offset
+        pattern = (value << shift).to_bytes(n_bytes + 1, "big")
+        mask = (full_mask << shift).to_bytes(n_bytes + 1, "big")
+
+        # Only the bytes the preamble fully covers can be searched for directly
+        core_start = 0 if bit_offset == 0 else 1
+        core = pattern[core_start:n_bytes]
+        edges = [
+            (i, mask[i], pattern[i])
+            for i in range(n_bytes + 1)
+            if mask[i] and mask[i] != 0xFF
+        ]
+        span = n_bytes if bit_offset == 0 else n_bytes + 1
+
+        pos = data.find(core, start + core_start, end)
+        while pos != -1:
+            byte_pos = pos - core_start
+            if (
+                byte_pos < stop
+                and byte_pos + span <= len(data)
+                and all(data[byte_pos + i] & m == v for i, m, v in edges)
+            ):
+                positions.append((byte_pos, bit_offset))
+            pos = data.find(core, pos + 1, end)
+
+    positions.sort()
+    return positions
+
+
+def _scan_tile(filename, preamble, start, stop):
+    """Find the preambles starting in data[start:stop] of a memory-mapped file"""
+    with map_file(filename) as data:
+        return find_preamble_positions(data, preamble, start, stop)
+
+
+def find_preamble_positions_parallel(filename, preamble, workers):
+    """
+    Find every bit-level occurrence of a preamble in a file, splitting the
+    file into one tile per worker process.
+
+    Each worker maps the file itself, so the pages are shared through the OS
+    page cache rather than copied. Returns the same list as
+    find_preamble_positions.
+    """
+    file_size = os.path.getsize(filename)
+    if file_size == 0:
+        return []
+    tile_size = -(-file_size // workers)
+    starts = range(0, file_size, tile_size)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        tiles = executor.map(
+            _scan_tile,
+            [filename] * len(starts),
+            [preamble] * len(starts),
+            starts,
+            [start + tile_size for start in starts],
+        )
+        return [position for tile in tiles for position in tile]
+
+
+def read_header_words(arr, starts, n_words):
+    """
+    Read n_words bit-reversed little-endian header words at each start offset.
+
+    Only the gathered bytes are bit-reversed, bytes past the end of arr read
+    as zeros, and each word is halved. Returns an (n_starts, n_words) array.
+    """
+    idx = starts[:, None] + np.arange(n_words * 4)
+    words = np.take(arr, idx, mode="clip")
+    words[idx >= len(arr)] = 0
+    return _RBIT_LUT[words].view("<u4") // 2
+
+
+def read_pixel_minimums(arr, starts, n_bytes=512):
+    """
+    Minimum decoded value of the n_bytes pixel bytes at each start offset.
+
+    Pixel bytes are stored bit-reversed (see BufferFormatter), so each block
+    is reversed before taking its minimum. Whole blocks are gathered through
+    a strided view of arr, and a block cut short by the end of arr only counts
+    the bytes it has. Every start must lie within arr.
+    """
+    is_whole = starts <= len(arr) - n_bytes
+    mins = np.empty(len(starts), dtype=np.uint8)
+    if is_whole.any():
+        blocks = np.lib.stride_tricks.sliding_window_view(arr, n_bytes)
+        mins[is_whole] = _RBIT_LUT[blocks[starts[is_whole]]].min(axis=1)
+    for i in np.flatnonzero(~is_whole).tolist():
+        mins[i] = _RBIT_LUT[arr[starts[i] :]].min()
+    return mins
+
+
+def find_preamble_and_analyze_pixels(filename, show=True, workers=1):
     """
     Look for preambles with both bit and byte reversal.
+
+    The plot of minimum pixel values is always saved, and is only shown
+    interactively when show is True. With more than one worker, the preamble
+    search is split across that many processes.
     """
     # Original firmware preamble (0x12345678)
     original_preamble = bytes.fromhex("12345678")
 
     # Apply both bit and byte reversal (as indicated by BufferFormatter)
-    def reverse_bits(b):
-        return int(format(b, "08b")[::-1], 2)
-
     # First reverse bytes, then reverse bits
     preamble_bytes = original_preamble[::-1]  # Byte reversal
-    preamble_bytes = bytes(reverse_bits(b) for b in preamble_bytes)  # Bit reversal
-
-    # Convert to bit pattern for searching
-    preamble_bits = "".join(format(b, "08b") for b in preamble_bytes)
-    header_fields = [
-        "linked_list",
-        "frame_num",
-        "buffer_count",
-        "frame_buffer_count",
-        "write_buffer_count",
-        "dropped_buffer_count",
-        "timestamp",
-        "write_timestamp",
-        "pixel_count",
-        "battery_voltage_raw",
-        "input_voltage_raw",
-        "unix_time",
-    ]
-
-    # Store pixel data by frame number
-    frame_pixels = defaultdict(list)
+    preamble_bytes = preamble_bytes.translate(_RBIT_TABLE)  # Bit reversal
 
-    with open(filename, "rb") as f:
-        data = f.read()
-
-    file_size = len(data)
-    print(f"File size: {file_size:,} bytes ({file_size / 1024 / 1024:.1f} MB)")
-
-    # Create bit streams
-    bit_stream = "".join(format(b, "08b") for b in data)
-    bit_stream_offset = "0" + bit_stream
-
-    print("\nAnalyzing headers with both bit alignments...")
+    with map_file(filename) as data:
 
-    # First find all preamble positions
-    all_positions = []
-    found_positions = set()
+        file_size = len(data)
+        print(f"File size: {file_size:,} bytes ({file_size / 1024 / 1024:.1f} MB)")
 
-    # Define both possible preamble patterns
-    preamble_bytes_patterns = [bytes.fromhex("1E6A2C48"), bytes.fromhex("8F351624")]
-    preamble_bits = "".join(format(b, "08b") for b in preamble_bytes_patterns[0])
+        print("\nAnalyzing headers with both bit alignments...")
 
-    for stream_idx, stream in enumerate([bit_stream, bit_stream_offset]):
-        pos = 0
-        while True:
-            pos = stream.find(preamble_bits, pos)
-            if pos == -1:
-                break
+        # First find all preamble positions
+        all_positions = []
 
-            # Adjust byte position based on which stream
-            if stream_idx == 0:
-                byte_pos = pos // 8
-                bit_offset = pos % 8
-            else:
-                byte_pos = (pos - 1) // 8
-                bit_offset = (pos - 1) % 8
+        # Define both possible preamble patterns
+        preamble_bytes_patterns = [bytes.fromhex("1E6A2C48"), bytes.fromhex("8F351624")]
 
+        # Positions come back sorted, so a repeated byte_pos directly follows the
+        # first hit at that byte
+        if workers > 1:
+            positions = find_preamble_positions_parallel(
+                filename, preamble_bytes, workers
+            )
+        else:
+            positions = find_preamble_positions(data, preamble_bytes)
+        for byte_pos, bit_offset in positions:
+            if all_positions and all_positions[-1][0] == byte_pos:
+                continue
             # Verify the actual bytes match either pattern
             found_bytes = data[byte_pos : byte_pos + 4]
             if any(found_bytes == pattern for pattern in preamble_bytes_patterns):
-                if byte_pos not in found_positions:
-                    all_positions.append((byte_pos, bit_offset))
-                    found_positions.add(byte_pos)
-
-            pos += 1
-
-    # Sort positions and start from second preamble
-    all_positions.sort()
-    frame_pixels = defaultdict(list)
-
-    # Process headers starting from second position
-    for count, (byte_pos, bit_offset) in enumerate(all_positions[1:]):
-        header_start = byte_pos + 4
-        header_data = data[header_start : header_start + 48]
-
-        # Parse header fields
-        values = {}
-        for idx, field in enumerate(header_fields):
-            word_start = idx * 4
-            word_bytes = header_data[word_start : word_start + 4]
-            bits_reversed = bytes(reverse_bits(b) for b in word_bytes)
-            value = int.from_bytes(bits_reversed, "little") // 2
-            values[field] = value
+                all_positions.append((byte_pos, bit_offset))
+
+        # Start from second preamble
+        header_starts = np.array(
+            [pos + 4 for pos, _ in all_positions[1:]], dtype=np.int64
+        )
+        pixel_starts = header_starts + 48
+
+        # Only the frame number is needed from every header; the full header is
+        # only parsed for the ones that get printed
+        arr = np.frombuffer(data, dtype=np.uint8)
+        frame_num_offset = _HEADER_DTYPE.fields["frame_num"][1]
+        frame_nums = read_header_words(arr, header_starts + frame_num_offset, 1)[:, 0]
+        values = read_header_words(arr, header_starts[:10], 12).view(_HEADER_DTYPE)[
+            :, 0
+        ]
 
         # Print first 10 headers
-        if count < 10:
+        for count, header_start in enumerate(header_starts[:10].tolist()):
+            byte_pos = header_start - 4
+            header_data = data[header_start : header_start + 48]
             print(f"\nHeader {count} at byte {byte_pos:,} (0x{byte_pos:08X})")
             print("-" * 60)
-            print(f"Preamble found: {' '.join(f'{b:02X}' for b in found_bytes)}")
+            preamble_found = data[byte_pos : byte_pos + 4]
+            print(f"Preamble found: {' '.join(f'{b:02X}' for b in preamble_found)}")
             print(f"Raw header: {' '.join(f'{b:02X}' for b in header_data[:16])}...")
             print("-" * 60)
-            for field, value in values.items():
+            for field, value in zip(_HEADER_DTYPE.names, values[count].item()):
                 print(f"{field:20}: {value:,}")
             print("-" * 60)
 
-        # Get pixel data
-        pixel_start = header_start + 48
-        pixel_data = data[pixel_start : pixel_start + 512]
-
-        if pixel_data:
-            min_pixel = min(pixel_data)
-            frame_pixels[values["frame_num"]].append(min_pixel)
+        # Minimum decoded value of each preamble's pixel data
+        has_pixels = pixel_starts < file_size
+        pixel_mins = read_pixel_minimums(arr, pixel_starts[has_pixels])
+        # The mapping can't be closed while a view of it is alive
+        del arr
 
     # Calculate minimum pixel value per frame
-    frame_mins = {frame: min(pixels) for frame, pixels in frame_pixels.items()}
+    frame_ids, inverse = np.unique(frame_nums[has_pixels], return_inverse=True)
+    mins = np.full(len(frame_ids), 0xFF, dtype=np.uint8)
+    np.minimum.at(mins, inverse, pixel_mins)
+    frame_mins = dict(zip(frame_ids.tolist(), mins.tolist()))
 
     # Print frame number analysis
-    frames = sorted(frame_mins.keys())
+    frames = frame_ids.tolist()
     print("\nFrame number analysis:")
     print(f"First frame: {frames[0]}")
     print(f"Last frame: {frames[-1]}")
@@ -249,18 +434,19 @@ def find_preamble_and_analyze_pixels(filename):
 
     # Plot results
     plt.figure(figsize=(12, 6))
-    plt.plot(frames, [frame_mins[f] for f in frames], "-")
+    plt.plot(frame_ids, mins, "-")
     plt.title("Minimum Pixel Value per Frame")
     plt.xlabel("Frame Number")
     plt.ylabel("Minimum Pixel Value")
     plt.grid(True)
     plt.savefig("min_pixels_per_frame.png")
-    plt.show()
+    if show:
+        plt.show()
     plt.close()
 
     print("\nAnalysis complete!")
-    print(f"Processed {len(frame_pixels)} unique frames")
-    print(f"Total preambles found: {len(found_positions)}")
+    print(f"Processed {len(frame_mins)} unique frames")
+    print(f"Total preambles found: {len(all_positions)}")
 
 
 def analyze_preamble_transformations():
@@ -268,10 +454,6 @@ def analyze_preamble_transformations():
     # Original firmware preamble
     preamble = bytes.fromhex("12345678")
 
-    # Function to reverse bits in a byte
-    def reverse_bits(b):
-        return int(format(b, "08b")[::-1], 2)
-
     print("\nPreamble transformation analysis:")
     print("-" * 60)
 
@@ -279,7 +461,7 @@ def analyze_preamble_transformations():
     print("Original:              ", " ".join(f"{b:02X}" for b in preamble))
 
     # 2. Bit-reversed only
-    bit_reversed = bytes(reverse_bits(b) for b in preamble)
+    bit_reversed = preamble.translate(_RBIT_TABLE)
     print("Bit-reversed:          ", " ".join(f"{b:02X}" for b in bit_reversed))
 
     # 3. Byte-reversed only
@@ -287,7 +469,7 @@ def analyze_preamble_transformations():
     print("Byte-reversed:         ", " ".join(f"{b:02X}" for b in byte_reversed))
 
     # 4. Both bit and byte reversed
-    both_reversed = bytes(reverse_bits(b) for b in byte_reversed)
+    both_reversed = byte_reversed.translate(_RBIT_TABLE)
     print("Bit+byte reversed:     ", " ".join(f"{b:02X}" for b in both_reversed))
 
     print("\nWhat we find in file:   8F 35 16 24")
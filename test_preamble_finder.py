@@ -0,0 +1,272 @@
+import random
+import re
+
+import numpy as np
+import pytest
+
+from preamble_finder import (
+    _HEADER_DTYPE,
+    _RBIT_TABLE,
+    analyze_blocks,
+    find_preamble_positions,
+    find_preamble_positions_parallel,
+    read_header_words,
+    read_pixel_minimums,
+    reverse_32bit_word,
+)
+
+PREAMBLE = bytes.fromhex("1E6A2C48")
+
+
+def brute_force_positions(data, preamble):
+    """Search a text bit stream of data, as the original analysis did"""
+    bits = "".join(format(b, "08b") for b in data)
+    preamble_bits = "".join(format(b, "08b") for b in preamble)
+    positions = []
+    pos = bits.find(preamble_bits)
+    while pos != -1:
+        positions.append(divmod(pos, 8))
+        pos = bits.find(preamble_bits, pos + 1)
+    return positions
+
+
+def embed(preamble, bit_pos, n_bytes, fill=0):
+    """Write preamble into n_bytes of fill bytes starting at bit_pos"""
+    n_bits = n_bytes * 8
+    value = int.from_bytes(bytes([fill]) * n_bytes, "big")
+    width = len(preamble) * 8
+    shift = n_bits - bit_pos - width
+    value &= ~(((1 << width) - 1) << shift)
+    value |= int.from_bytes(preamble, "big") << shift
+    return value.to_bytes(n_bytes, "big")
+
+
+def test_reverse_32bit_word():
+    rng = random.Random(0)
+    words = [bytes(4), b"\xff" * 4, bytes.fromhex("12345678")]
+    words += [rng.randbytes(4) for _ in range(1000)]
+    for word in words:
+        rev_bytes = word[::-1]
+        expected = [
+            word,
+            rev_bytes,
+            word.translate(_RBIT_TABLE),
+            rev_bytes.translate(_RBIT_TABLE),
+        ]
+        assert reverse_32bit_word(word) == expected
+
+
+@pytest.mark.parametrize("bit_offset", range(8))
+@pytest.mark.parametrize("fill", [0x00, 0xFF])
+def test_find_preamble_positions_offsets(bit_offset, fill):
+    # At the very start, in the middle and flush against the end of the buffer
+    n_bytes = 16
+    last = n_bytes * 8 - len(PREAMBLE) * 8
+    for bit_pos in (bit_offset, 48 + bit_offset, last - (last - bit_offset) % 8):
+        data = embed(PREAMBLE, bit_pos, n_bytes, fill)
+        positions = find_preamble_positions(data, PREAMBLE)
+        assert (bit_pos // 8, bit_pos % 8) in positions
+        assert positions == brute_force_positions(data, PREAMBLE)
+
+
+def test_find_preamble_positions_random():
+    rng = random.Random(1)
+    # Bytes of the preamble at both shifts seen in recordings, to get dense hits
+    alphabet = list(PREAMBLE + bytes.fromhex("8F351624")) + [0x00, 0xFF]
+    for _ in range(300):
+        data = bytes(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        preamble = PREAMBLE[: rng.randint(1, 4)]
+        assert find_preamble_positions(data, preamble) == brute_force_positions(
+            data, preamble
+        )
+
+
+def test_find_preamble_positions_bounds():
+    rng = random.Random(2)
+    data = b"".join(
+        embed(PREAMBLE, rng.randrange(8, 57), 12, rng.choice([0x00, 0xFF]))
+        for _ in range(20)
+    )
+    expected = brute_force_positions(data, PREAMBLE)
+    for start in range(0, len(data), 7):
+        for stop in (start, start + 5, start + 31, len(data)):
+            assert find_preamble_positions(data, PREAMBLE, start, stop) == [
+                p for p in expected if start <= p[0] < stop
+            ]
+
+
+@pytest.mark.parametrize("workers", [1, 2, 3, 7])
+def test_find_preamble_positions_parallel(tmp_path, workers):
+    rng = random.Random(3)
+    data = b"".join(
+        embed(PREAMBLE, rng.randrange(0, 33), 8, rng.choice([0x00, 0xFF]))
+        for _ in range(50)
+    )
+    filename = tmp_path / "data.bin"
+    filename.write_bytes(data)
+    assert find_preamble_positions_parallel(
+        filename, PREAMBLE, workers
+    ) == find_preamble_positions(data, PREAMBLE)
+
+
+def test_find_preamble_positions_parallel_empty(tmp_path):
+    filename = tmp_path / "empty.bin"
+    filename.write_bytes(b"")
+    assert find_preamble_positions_parallel(filename, PREAMBLE, 4) == []
+
+
+def reported_blocks(output):
+    """Blocks analyze_blocks printed a preamble window or interesting values for"""
+    preamble_blocks, interesting = set(), set()
+    for line in output.splitlines():
+        if match := re.match(r"Found preamble pattern near block (\d+)", line):
+            preamble_blocks.add(int(match[1]))
+        elif match := re.match(r"Interesting values at block (\d+)", line):
+            block_num = int(match[1])
+        elif match := re.match(r"Values \((\w+)-endian\)", line):
+            interesting.add((block_num, match[1]))
+    return preamble_blocks, interesting
+
+
+def expected_blocks(data, block_size=512):
+    """Apply the per-block rule analyze_blocks vectorizes, one block at a time"""
+    preamble = bytes.fromhex("12345678")
+    preamble_reversed = preamble.translate(_RBIT_TABLE)
+    preamble_blocks, interesting = set(), set()
+    for block_num in range(len(data) // block_size - 8):
+        block_start = block_num * block_size
+        window = data[max(block_start - 32, 0) : block_start + 64]
+        if preamble in window or preamble_reversed in window:
+            preamble_blocks.add(block_num)
+        header_reversed = data[block_start : block_start + 32].translate(_RBIT_TABLE)
+        for byte_order in ["little", "big"]:
+            values = [
+                int.from_bytes(header_reversed[i : i + 4], byte_order)
+                for i in range(0, 32, 4)
+            ]
+            if any(18700 < v < 18900 or v < 8 or 149000 < v < 151000 for v in values):
+                interesting.add((block_num, byte_order))
+    return preamble_blocks, interesting
+
+
+def block_file(tmp_path, n_blocks, preambles=(), words=()):
+    """
+    Write n_blocks of 0xFF bytes with preambles placed at (pos, pattern) and
+    header words placed at (block_num, word, value, byte_order), stored
+    bit-reversed like the recordings.
+    """
+    data = bytearray(b"\xff" * (n_blocks * 512))
+    for pos, pattern in preambles:
+        data[pos : pos + len(pattern)] = pattern
+    for block_num, word, value, byte_order in words:
+        pos = block_num * 512 + word * 4
+        data[pos : pos + 4] = value.to_bytes(4, byte_order).translate(_RBIT_TABLE)
+    filename = tmp_path / "blocks.bin"
+    filename.write_bytes(bytes(data))
+    return filename, bytes(data)
+
+
+def window_edge_file(tmp_path):
+    preamble = bytes.fromhex("12345678")
+    preamble_reversed = preamble.translate(_RBIT_TABLE)
+    return block_file(
+        tmp_path,
+        24,
+        preambles=[
+            (0, preamble),
+            (4 * 512 - 32, preamble),  # First byte of the window before block 4
+            (7 * 512 - 33, preamble_reversed),  # One byte before it
+            (10 * 512 + 60, preamble),  # Last bytes of the window after block 10
+            (13 * 512 + 61, preamble_reversed),  # One byte past it
+        ],
+        words=[
+            (2, 0, 18800, "little"),
+            (5, 7, 7, "big"),
+            (15, 3, 150000, "little"),
+            (12, 1, 18701, "big"),
+            (24 - 8, 0, 18800, "little"),  # First block that isn't checked
+        ],
+    )
+
+
+def test_analyze_blocks_window_edges(tmp_path, capsys):
+    filename, data = window_edge_file(tmp_path)
+    analyze_blocks(filename)
+    reported = reported_blocks(capsys.readouterr().out)
+    assert reported == expected_blocks(data)
+    assert {4, 10} <= reported[0]
+    assert not {7, 13} & reported[0]
+
+
+@pytest.mark.parametrize("n_blocks", [0, 1, 8, 9])
+def test_analyze_blocks_few_blocks(tmp_path, capsys, n_blocks):
+    filename, data = block_file(
+        tmp_path,
+        n_blocks,
+        preambles=[(0, bytes.fromhex("12345678"))] if n_blocks else [],
+        words=[(0, 4, 18800, "little")] if n_blocks else [],
+    )
+    analyze_blocks(filename)
+    reported = reported_blocks(capsys.readouterr().out)
+    assert reported == expected_blocks(data)
+    assert reported == ((set(), set()) if n_blocks < 9 else ({0}, {(0, "little")}))
+
+
+@pytest.mark.parametrize("tile_size", [1, 512, 3 * 512, 1 << 16])
+def test_analyze_blocks_tiles(tmp_path, capsys, tile_size):
+    filename, data = window_edge_file(tmp_path)
+    analyze_blocks(filename, tile_size=tile_size)
+    assert reported_blocks(capsys.readouterr().out) == expected_blocks(data)
+
+
+def expected_header_words(data, start, n_words):
+    """Read each header word from the bytes that exist, one word at a time"""
+    return [
+        int.from_bytes(data[pos : pos + 4].translate(_RBIT_TABLE), "little") // 2
+        for pos in range(start, start + n_words * 4, 4)
+    ]
+
+
+def test_read_header_words_past_end():
+    data = random.Random(4).randbytes(200)
+    arr = np.frombuffer(data, dtype=np.uint8)
+    # Whole headers, headers cut short mid-word and on a word boundary, and
+    # one starting past the end
+    starts = np.array([0, 100, 152, 160, 170, 198, 199, 200], dtype=np.int64)
+    words = read_header_words(arr, starts, 12)
+    assert words.shape == (len(starts), 12)
+    for start, row in zip(starts.tolist(), words.tolist()):
+        assert row == expected_header_words(data, start, 12)
+
+
+def test_read_header_words_frame_num():
+    # Reading just the frame_num word gives the same value as the full header
+    data = random.Random(5).randbytes(300)
+    arr = np.frombuffer(data, dtype=np.uint8)
+    starts = np.array([0, 52, 200, 254, 294, 297], dtype=np.int64)
+    offset = _HEADER_DTYPE.fields["frame_num"][1]
+    frame_nums = read_header_words(arr, starts + offset, 1)[:, 0]
+    headers = read_header_words(arr, starts, 12).view(_HEADER_DTYPE)[:, 0]
+    assert frame_nums.tolist() == headers["frame_num"].tolist()
+
+
+def test_read_pixel_minimums():
+    data = random.Random(6).randbytes(2000)
+    arr = np.frombuffer(data, dtype=np.uint8)
+    # Whole blocks, one ending exactly at the end and ones cut short by it
+    starts = np.array([0, 700, 1000, 1488, 1489, 1900, 1999], dtype=np.int64)
+    mins = read_pixel_minimums(arr, starts)
+    for start, value in zip(starts.tolist(), mins.tolist()):
+        assert value == min(_RBIT_TABLE[b] for b in data[start : start + 512])
+
+
+@pytest.mark.parametrize("start", [0, 100])
+def test_read_pixel_minimums_bit_reversed(start):
+    # A raw 0x08 decodes to 16, while the raw 0x10 next to it decodes to 8
+    data = b"\xff" * 600
+    data = data[:start] + b"\x08" + data[start + 1 :]
+    arr = np.frombuffer(data, dtype=np.uint8)
+    assert read_pixel_minimums(arr, np.array([start]))[0] == 16
+    data = data[: start + 1] + b"\x10" + data[start + 2 :]
+    arr = np.frombuffer(data, dtype=np.uint8)
+    assert read_pixel_minimums(arr, np.array([start]))[0] == 8